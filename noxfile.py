@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import nox
 
 nox.options.stop_on_first_error = True
@@ -5,29 +7,39 @@ nox.options.reuse_existing_virtualenvs = True
 nox.options.keywords = "test + mypy"
 
 
+def install_respx(session):
+    # Skip editable re-install of respx when reusing an existing virtualenv
+    site_packages = Path(session.virtualenv.location).glob("lib/python*/site-packages")
+    if not any(
+        any(path.glob("__editable__*respx*")) or (path / "respx.egg-link").exists()
+        for path in site_packages
+    ):
+        session.install("-e", ".")
+
+
 @nox.session(python=["3.8", "3.9", "3.10", "3.11", "3.12", "3.13"])
 def test(session):
-    deps = ["pytest", "pytest-asyncio", "pytest-cov", "trio", "starlette", "flask"]
-    session.install("--upgrade", *deps)
-    session.install("-e", ".")
+    session.install("--upgrade", "-r", "requirements/test.txt")
+    install_respx(session)
 
     if any(option in session.posargs for option in ("-k", "-x")):
         session.posargs.append("--no-cov")
+    else:
+        session.posargs.extend(["-n", "auto", "--dist=loadfile"])
 
     session.run("pytest", *session.posargs)
 
 
 @nox.session(python="3.8")
 def mypy(session):
-    session.install("--upgrade", "mypy")
-    session.install("-e", ".")
+    session.install("--upgrade", "-r", "requirements/mypy.txt")
+    install_respx(session)
     session.run("mypy")
 
 
 @nox.session(python="3.10")
 def docs(session):
-    deps = ["mkdocs", "mkdocs-material", "mkautodoc>=0.1.0"]
-    session.install("--upgrade", *deps)
-    session.install("-e", ".")
+    session.install("--upgrade", "-r", "requirements/docs.txt")
+    install_respx(session)
     args = session.posargs if session.posargs else ["build"]
     session.run("mkdocs", *args)
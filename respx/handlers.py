@@ -4,6 +4,8 @@ import httpx
 
 
 class TransportHandler:
+    __slots__ = ("transport",)
+
     def __init__(self, transport: httpx.BaseTransport) -> None:
         self.transport = transport
 
@@ -18,6 +20,8 @@ class TransportHandler:
 
 
 class AsyncTransportHandler:
+    __slots__ = ("transport",)
+
     def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
         self.transport = transport
 
@@ -32,10 +36,14 @@ class AsyncTransportHandler:
 
 
 class WSGIHandler(TransportHandler):
+    __slots__ = ()
+
     def __init__(self, app: Callable, **kwargs: Any) -> None:
         super().__init__(httpx.WSGITransport(app=app, **kwargs))
 
 
 class ASGIHandler(AsyncTransportHandler):
+    __slots__ = ()
+
     def __init__(self, app: Callable, **kwargs: Any) -> None:
         super().__init__(httpx.ASGITransport(app=app, **kwargs))
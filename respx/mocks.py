@@ -1,8 +1,10 @@
 import inspect
 from abc import ABC
+from functools import lru_cache
+from importlib import import_module
 from types import MappingProxyType
-from typing import TYPE_CHECKING, ClassVar, Dict, List, Type
-from unittest import mock
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Tuple, Type
+from weakref import WeakKeyDictionary
 
 import httpcore
 import httpx
@@ -18,8 +20,33 @@ if TYPE_CHECKING:
 __all__ = ["Mocker", "HTTPCoreMocker"]
 
 
+@lru_cache(maxsize=None)
+def _get_spec_args(spec: Callable) -> Tuple[List[str], Dict[str, Any]]:
+    # Resolve spec arg names and defaults once, instead of per request or patch
+    argspec = inspect.getfullargspec(spec)
+    arg_names = argspec.args[1:]  # Omit self
+    defaults = (
+        dict(zip(arg_names[-len(argspec.defaults) :], argspec.defaults))
+        if argspec.defaults
+        else dict()
+    )
+    return arg_names, defaults
+
+
+def _resolve_target(target: str) -> Any:
+    path, _, name = target.rpartition(".")
+    try:
+        obj = import_module(path)
+    except ImportError:
+        # Not a module, resolve as an attribute of its parent, if any
+        if "." not in path:
+            raise
+        obj = _resolve_target(path)
+    return getattr(obj, name)
+
+
 class Mocker(ABC):
-    _patches: ClassVar[List[mock._patch]]
+    _patches: ClassVar[List[Tuple[Any, str, Any, bool]]]
     name: ClassVar[str]
     routers: ClassVar[List["Router"]]
     targets: ClassVar[List[str]]
@@ -56,14 +83,20 @@ class Mocker(ABC):
 
     @classmethod
     def add_targets(cls, *targets: str) -> None:
-        targets = tuple(filter(lambda t: t not in cls.targets, targets))
+        targets = tuple(target for target in targets if target not in cls.targets)
+        for target in targets:
+            # Fail on unknown target modules, before restarting any patching
+            try:
+                _resolve_target(target)
+            except AttributeError:
+                pass
         if targets:
             cls.targets.extend(targets)
             cls.restart()
 
     @classmethod
     def remove_targets(cls, *targets: str) -> None:
-        targets = tuple(filter(lambda t: t in cls.targets, targets))
+        targets = tuple(target for target in targets if target in cls.targets)
         if targets:
             for target in targets:
                 cls.targets.remove(target)
@@ -76,15 +109,28 @@ class Mocker(ABC):
             return
 
         # Start patching target transports
-        for target in cls.targets:
-            for method in cls.target_methods:
+        try:
+            for target in cls.targets:
                 try:
-                    spec = f"{target}.{method}"
-                    patch = mock.patch(spec, spec=True, new_callable=cls.mock)
-                    patch.start()
-                    cls._patches.append(patch)
+                    # Resolve target once, instead of importing it per patched method
+                    target_obj = _resolve_target(target)
                 except AttributeError:
-                    pass
+                    continue
+                for method in cls.target_methods:
+                    # Patch by direct assignment, remembering the original to
+                    # restore, and whether it is local or e.g. inherited
+                    local = method in getattr(target_obj, "__dict__", {})
+                    original = getattr(target_obj, method, None)
+                    if original is None:
+                        continue
+                    if local:
+                        original = target_obj.__dict__[method]
+                    setattr(target_obj, method, cls.mock(original))
+                    cls._patches.append((target_obj, method, original, local))
+        except ImportError:
+            # Unknown target module, undo any patched targets before failing
+            cls.stop(force=True)
+            raise
 
     @classmethod
     def stop(cls, force: bool = False) -> None:
@@ -92,10 +138,15 @@ class Mocker(ABC):
         if cls.routers and not force:
             return
 
-        # Stop patching HTTPX
+        # Stop patching HTTPX, in reverse order for overlapping targets,
+        # deleting the override of any inherited method
         while cls._patches:
-            patch = cls._patches.pop()
-            patch.stop()
+            target_obj, method, original, local = cls._patches.pop()
+            if not local:
+                delattr(target_obj, method)
+            if local or not hasattr(target_obj, method):
+                # Local, or e.g. a slot without a class default to fall back on
+                setattr(target_obj, method, original)
 
     @classmethod
     def restart(cls) -> None:
@@ -151,15 +202,27 @@ class HTTPXMocker(Mocker):
 
     @classmethod
     def mock(cls, spec):
+        # Mock transports are stateless, create them once per patch
+        sync_mock_transport = httpx.MockTransport(cls.handler)
+        async_mock_transport = httpx.MockTransport(cls.async_handler)
+
+        # Wrap each client transport once, instead of per request
+        client_transports: WeakKeyDictionary = WeakKeyDictionary()
+
         def _transport_for_url(self, *args, **kwargs):
-            handler = (
-                cls.async_handler
-                if inspect.iscoroutinefunction(self.request)
-                else cls.handler
-            )
-            mock_transport = httpx.MockTransport(handler)
             pass_through_transport = spec(self, *args, **kwargs)
-            transport = TryTransport([mock_transport, pass_through_transport])
+            transports = client_transports.get(self)
+            if transports is None:
+                transports = client_transports[self] = {}
+            transport = transports.get(pass_through_transport)
+            if transport is None:
+                mock_transport = (
+                    async_mock_transport
+                    if isinstance(self, httpx.AsyncClient)
+                    else sync_mock_transport
+                )
+                transport = TryTransport([mock_transport, pass_through_transport])
+                transports[pass_through_transport] = transport
             return transport
 
         return _transport_for_url
@@ -172,10 +235,10 @@ class AbstractRequestMocker(Mocker):
             # Prevent mocking mock
             return spec
 
-        argspec = inspect.getfullargspec(spec)
+        arg_names, defaults = _get_spec_args(spec)
 
         def mock(self, *args, **kwargs):
-            kwargs = cls._merge_args_and_kwargs(argspec, args, kwargs)
+            kwargs = cls._merge_args_and_kwargs(arg_names, defaults, args, kwargs)
             request = cls.to_httpx_request(**kwargs)
             request, kwargs = cls.prepare_sync_request(request, **kwargs)
             response = cls._send_sync_request(
@@ -184,7 +247,7 @@ class AbstractRequestMocker(Mocker):
             return response
 
         async def amock(self, *args, **kwargs):
-            kwargs = cls._merge_args_and_kwargs(argspec, args, kwargs)
+            kwargs = cls._merge_args_and_kwargs(arg_names, defaults, args, kwargs)
             request = cls.to_httpx_request(**kwargs)
             request, kwargs = await cls.prepare_async_request(request, **kwargs)
             response = await cls._send_async_request(
@@ -195,13 +258,8 @@ class AbstractRequestMocker(Mocker):
         return amock if inspect.iscoroutinefunction(spec) else mock
 
     @classmethod
-    def _merge_args_and_kwargs(cls, argspec, args, kwargs):
-        arg_names = argspec.args[1:]  # Omit self
-        new_kwargs = (
-            dict(zip(arg_names[-len(argspec.defaults) :], argspec.defaults))
-            if argspec.defaults
-            else dict()
-        )
+    def _merge_args_and_kwargs(cls, arg_names, defaults, args, kwargs):
+        new_kwargs = dict(defaults)
         new_kwargs.update(zip(arg_names, args))
         new_kwargs.update(kwargs)
         return new_kwargs
@@ -297,11 +355,7 @@ class HTTPCoreMocker(AbstractRequestMocker):
         Create a `HTTPX` request from transport request arg.
         """
         request = kwargs["request"]
-        method = (
-            request.method.decode("ascii")
-            if isinstance(request.method, bytes)
-            else request.method
-        )
+        method = request.method.decode("ascii")
         raw_url = (
             request.url.scheme,
             request.url.host,
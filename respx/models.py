@@ -1,12 +1,15 @@
 import inspect
+from heapq import merge
 from typing import (
     Any,
     Dict,
+    FrozenSet,
     Iterator,
     List,
     NamedTuple,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -18,7 +21,7 @@ import httpx
 
 from respx.utils import SetCookie
 
-from .patterns import M, Pattern
+from .patterns import Host, M, Method, Path, Pattern, get_values, strip_values
 from .types import (
     CallableSideEffect,
     Content,
@@ -35,13 +38,17 @@ def clone_response(response: httpx.Response, request: httpx.Request) -> httpx.Re
     """
     Clones a httpx Response for given request.
     """
+    template = response
     response = httpx.Response(
-        response.status_code,
-        headers=response.headers,
-        stream=response.stream,
+        template.status_code,
+        headers=template.headers,
+        stream=template.stream,
         request=request,
-        extensions=dict(response.extensions),
+        extensions=dict(template.extensions),
     )
+    if isinstance(template.stream, httpx.ByteStream) and hasattr(template, "_content"):
+        # Re-use already read content, instead of re-reading the stream per clone
+        response._content = template._content
     return response
 
 
@@ -60,23 +67,68 @@ class Call(NamedTuple):
         return self.optional_response is not None
 
 
-class CallList(list, mock.NonCallableMock):
+class CallList(list):
+    """
+    Call history, with the assert helpers of a mock object.
+    """
+
     def __init__(self, *args: Sequence[Call], name: Any = "respx") -> None:
         super().__init__(*args)
-        mock.NonCallableMock.__init__(self, name=name)
+        self._name = name
 
     @property
-    def called(self) -> bool:  # type: ignore[override]
+    def called(self) -> bool:
         return bool(self)
 
     @property
-    def call_count(self) -> int:  # type: ignore[override]
+    def call_count(self) -> int:
         return len(self)
 
     @property
     def last(self) -> Call:
         return self[-1]
 
+    def assert_called(self) -> None:
+        if not self.called:
+            raise AssertionError(f"Expected '{self._name}' to have been called.")
+
+    def assert_not_called(self) -> None:
+        if self.called:
+            raise AssertionError(
+                f"Expected '{self._name}' to not have been called. "
+                f"Called {self.call_count} times."
+            )
+
+    def assert_called_once(self) -> None:
+        if self.call_count != 1:
+            raise AssertionError(
+                f"Expected '{self._name}' to have been called once. "
+                f"Called {self.call_count} times."
+            )
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Deprecated remaining NonCallableMock API, e.g. assert_called_with,
+        delegated to a mock created on first use.
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        warn(
+            f"CallList.{name} is deprecated. "
+            "Please use the call list and its documented helpers instead.",
+            category=DeprecationWarning,
+            stacklevel=2,
+        )
+        mock_delegate = self.__dict__.get("_mock")
+        if mock_delegate is None:
+            mock_delegate = self._mock = mock.NonCallableMock(name=self._name)
+
+        # Keep the mock in sync with the recorded calls, as the former mock base
+        mock_delegate.called = self.called
+        mock_delegate.call_count = self.call_count
+        return getattr(mock_delegate, name)
+
     def record(
         self, request: httpx.Request, response: Optional[httpx.Response]
     ) -> Call:
@@ -109,23 +161,26 @@ class MockResponse(httpx.Response):
         if http_version:
             kwargs["extensions"] = kwargs.get("extensions", {})
             kwargs["extensions"]["http_version"] = http_version.encode("ascii")
-        super().__init__(status_code or 200, **kwargs)
-
-        if content_type:
-            self.headers["Content-Type"] = content_type
-
-        if cookies:
-            if isinstance(cookies, dict):
-                cookies = tuple(cookies.items())
-            self.headers = httpx.Headers(
-                (
-                    *self.headers.multi_items(),
-                    *(
-                        cookie if isinstance(cookie, SetCookie) else SetCookie(*cookie)
-                        for cookie in cookies
-                    ),
+        if content_type or cookies:
+            # Merge in extra headers up front, to only build response headers once
+            headers: List[Tuple[Any, Any]] = []
+            if kwargs.get("headers"):
+                headers.extend(
+                    (key, value)
+                    for key, value in httpx.Headers(kwargs["headers"]).raw
+                    if not content_type or key.lower() != b"content-type"
                 )
-            )
+            if content_type:
+                headers.append(("Content-Type", content_type))
+            if cookies:
+                if isinstance(cookies, dict):
+                    cookies = tuple(cookies.items())
+                headers.extend(
+                    cookie if isinstance(cookie, SetCookie) else SetCookie(*cookie)
+                    for cookie in cookies
+                )
+            kwargs["headers"] = headers
+        super().__init__(status_code or 200, **kwargs)
 
 
 class Route:
@@ -140,6 +195,8 @@ class Route:
         self._pass_through: bool = False
         self._name: Optional[str] = None
         self._snapshots: List[Tuple] = []
+        self._effect_args: Tuple[Optional[CallableSideEffect], List[str]] = (None, [])
+        self._index_keys: Optional[Tuple[Pattern, IndexKeys]] = None
         self.calls = CallList(name=self)
         self.snapshot()
 
@@ -329,11 +386,15 @@ class Route:
     def _call_side_effect(
         self, effect: CallableSideEffect, request: httpx.Request, **kwargs: Any
     ) -> RouteResultTypes:
+        # Inspect side effect args once, and re-use for subsequent calls
+        if self._effect_args[0] is not effect:
+            self._effect_args = (effect, inspect.getfullargspec(effect).args)
+        __, effect_args = self._effect_args
+
         # Add route kwarg if the side effect wants it
-        argspec = inspect.getfullargspec(effect)
         if "route" in kwargs:
             warn(f"Matched context contains reserved word `route`: {self.pattern!r}")
-        if "route" in argspec.args:
+        if "route" in effect_args:
             kwargs["route"] = self
 
         try:
@@ -342,11 +403,11 @@ class Route:
         except Exception as error:
             raise SideEffectError(self, origin=error) from error
 
-        # Validate result
+        # Validate result, checking the common response/request results first
         if (
             result
-            and not inspect.isawaitable(result)
             and not isinstance(result, (httpx.Response, httpx.Request))
+            and not inspect.isawaitable(result)
         ):
             raise TypeError(
                 f"Side effects must return; either a `httpx.Response`,"
@@ -413,10 +474,22 @@ class Route:
         Returns None for a non-matching route, mocked response for a match,
         or input request for pass-through.
         """
+        return self._match(request, self._pattern)
+
+    def _match(
+        self,
+        request: httpx.Request,
+        pattern: Pattern,
+        parsed: Optional[Dict[str, Any]] = None,
+    ) -> RouteResultTypes:
+        """
+        Matches and resolves request with given, possibly partial, route pattern,
+        and optional parsed request values shared across routes.
+        """
         context: Dict[str, Any] = {}
 
-        if self._pattern:
-            match = self._pattern.match(request)
+        if pattern:
+            match = pattern.match(request, parsed)
             if not match:
                 return None
             context = match.context
@@ -428,9 +501,42 @@ class Route:
         return result
 
 
+# Pattern left to match when found by the index, and exact methods, hosts and paths
+IndexKeys = Tuple[
+    Pattern,
+    Optional[FrozenSet[Any]],
+    Optional[FrozenSet[Any]],
+    Optional[FrozenSet[Any]],
+]
+
+
+def _indexable(values: Optional[FrozenSet[Any]]) -> Optional[FrozenSet[Any]]:
+    """
+    Returns given exact values if the route index can be keyed by them,
+    i.e. request str values, otherwise None to not restrict the route.
+    """
+    if values is not None and all(isinstance(value, str) for value in values):
+        return values
+    return None
+
+
+# Route by position, with its pattern left to match when found by the index
+IndexedRoute = Tuple[int, Route, Pattern]
+RouteIndex = Tuple[
+    List[IndexedRoute],  # routes matching any url
+    Dict[str, List[IndexedRoute]],  # routes by host, any path
+    Dict[Tuple[str, str], List[IndexedRoute]],  # routes by host+path
+]
+
+
 class RouteList:
     _routes: List[Route]
     _names: Dict[str, Route]
+    _methods: Dict[Optional[str], RouteIndex]
+    _candidates: Dict[Tuple[str, str, str], Tuple[Tuple[Route, Pattern], ...]]
+
+    # Max number of cached candidate routes, by method, host and path
+    CANDIDATES_CACHE_SIZE = 512
 
     def __init__(self, routes: Optional["RouteList"] = None) -> None:
         if routes is None:
@@ -439,6 +545,8 @@ class RouteList:
         else:
             self._routes = list(routes._routes)
             self._names = dict(routes._names)
+        self._methods = {}
+        self._candidates = {}
 
     def __repr__(self) -> str:
         return repr(self._routes)  # pragma: nocover
@@ -469,10 +577,109 @@ class RouteList:
             raise TypeError("Can't slice assign routes")
         self._routes = list(routes._routes)
         self._names = dict(routes._names)
+        self._reindex()
+
+    @staticmethod
+    def _index_keys(pattern: Pattern) -> IndexKeys:
+        route_methods = _indexable(get_values(pattern, Method.key))
+        hosts = _indexable(get_values(pattern, Host.key))
+        paths = _indexable(get_values(pattern, Path.key))
+        # Strip exact lookups guaranteed by the index, from the pattern to match
+        indexed_keys = set()
+        if route_methods is not None:
+            indexed_keys.add(Method.key)
+        if hosts is not None:
+            indexed_keys.add(Host.key)
+            if paths is not None:
+                indexed_keys.add(Path.key)
+        pattern = strip_values(pattern, *indexed_keys)
+        return pattern, route_methods, hosts, paths
+
+    def _index(self) -> Dict[Optional[str], RouteIndex]:
+        """
+        Indexes routes by method, and by exact host and path, in a single pass.
+
+        Routes with an exact host, but no exact path, e.g. a regex path,
+        are indexed by host only.
+
+        Routes for methods not bound by any route are indexed under `None`.
+        """
+        keys = []
+        for route in self._routes:
+            # Index keys are kept on the route, as long as its pattern is unchanged,
+            # to not walk the patterns of all routes on every reindex, e.g. rollback
+            cached = route._index_keys
+            if cached is None or cached[0] is not route._pattern:
+                cached = (route._pattern, self._index_keys(route._pattern))
+                route._index_keys = cached
+            keys.append((route, *cached[1]))
+
+        methods: Set[Optional[str]] = {None}
+        for _, _, route_methods, _, _ in keys:
+            methods.update(route_methods or ())
+
+        indexes: Dict[Optional[str], RouteIndex] = {}
+        for method in methods:
+            any_url: List[IndexedRoute] = []
+            by_host: Dict[str, List[IndexedRoute]] = {}
+            by_url: Dict[Tuple[str, str], List[IndexedRoute]] = {}
+            for position, (route, pattern, route_methods, hosts, paths) in enumerate(
+                keys
+            ):
+                if route_methods is not None and method not in route_methods:
+                    continue
+                indexed_route = (position, route, pattern)
+                if hosts is None:
+                    any_url.append(indexed_route)
+                    continue
+                for host in hosts:
+                    if paths is None:
+                        by_host.setdefault(host, []).append(indexed_route)
+                        continue
+                    for path in paths:
+                        by_url.setdefault((host, path), []).append(indexed_route)
+            indexes[method] = (any_url, by_host, by_url)
+        return indexes
+
+    def _reindex(self) -> None:
+        self._methods.clear()
+        self._candidates.clear()
+
+    def for_request(self, request: httpx.Request) -> Iterator[Tuple[Route, Pattern]]:
+        """
+        Returns routes, in order, that may match given request,
+        together with the part of their pattern left to match.
+        """
+        url = request.url
+        key = (request.method, url.host, url.path)
+        candidates = self._candidates.get(key)
+        if candidates is not None:
+            return iter(candidates)
+
+        if not self._methods:
+            self._methods = self._index()
+
+        index = self._methods.get(request.method) or self._methods[None]
+        any_url, by_host, by_url = index
+        host_routes = by_host.get(url.host)
+        url_routes = by_url.get((url.host, url.path))
+        if host_routes or url_routes:
+            merged = merge(any_url, host_routes or (), url_routes or ())
+            candidates = tuple((route, pattern) for __, route, pattern in merged)
+        else:
+            candidates = tuple((route, pattern) for __, route, pattern in any_url)
+
+        if len(self._candidates) >= self.CANDIDATES_CACHE_SIZE:
+            # Evict the oldest cached candidates
+            del self._candidates[next(iter(self._candidates))]
+        self._candidates[key] = candidates
+
+        return iter(candidates)
 
     def clear(self) -> None:
         self._routes.clear()
         self._names.clear()
+        self._reindex()
 
     def add(self, route: Route, name: Optional[str] = None) -> Route:
         # Find route with same name
@@ -509,6 +716,7 @@ class RouteList:
             route._name = name
             self._names[name] = route
 
+        self._reindex()
         return route
 
     def pop(self, name, default=...):
@@ -517,15 +725,16 @@ class RouteList:
 
         Raises KeyError when `default` not provided and name is not found.
         """
-        try:
-            route = self._names.pop(name)
-            self._routes.remove(route)
-            return route
-        except KeyError as ex:
+        route = self._names.pop(name, None)
+        if route is None:
             if default is ...:
-                raise ex
+                raise KeyError(name)
             return default
 
+        self._routes.remove(route)
+        self._reindex()
+        return route
+
 
 class AllMockedAssertionError(AssertionError):
     pass
@@ -3,9 +3,10 @@ import json as jsonlib
 import operator
 import pathlib
 import re
+import sys
 from abc import ABC
 from enum import Enum
-from functools import reduce
+from functools import cached_property, lru_cache, reduce
 from http.cookies import SimpleCookie
 from types import MappingProxyType
 from typing import (
@@ -13,6 +14,7 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    FrozenSet,
     List,
     Mapping,
     Optional,
@@ -22,6 +24,7 @@ from typing import (
     Tuple,
     Type,
     Union,
+    cast,
 )
 from unittest.mock import ANY
 from urllib.parse import urljoin
@@ -50,6 +53,8 @@ class Lookup(Enum):
 
 
 class Match:
+    __slots__ = ("matches", "context")
+
     def __init__(self, matches: bool, **context: Any) -> None:
         self.matches = matches
         self.context = context
@@ -69,9 +74,15 @@ class Pattern(ABC):
     key: ClassVar[str]
     lookups: ClassVar[Tuple[Lookup, ...]] = (Lookup.EQUAL,)
 
+    # Whether the parsed request value only depends on the request, and may be
+    # shared with other patterns of the same key when matching the same request
+    shared_parse: ClassVar[bool] = False
+
     lookup: Lookup
     base: Optional["Pattern"]
     value: Any
+    _in_values: Union[str, FrozenSet[Any]]
+    _lookup_method: Callable[[Any], Match]
 
     # Automatically register all the subclasses in this dict
     __registry: ClassVar[Dict[str, Type["Pattern"]]] = {}
@@ -97,6 +108,12 @@ class Pattern(ABC):
         self.lookup = lookup or self.lookups[0]
         self.base = None
         self.value = self.clean(value)
+        if self.lookup is Lookup.IN:
+            # Keep given value, but look up non-str values in constant time
+            self._in_values = (
+                self.value if isinstance(self.value, str) else frozenset(self.value)
+            )
+        self._lookup_method = getattr(self, f"_{self.lookup.value}")
 
     def __iter__(self):
         yield self
@@ -127,9 +144,22 @@ class Pattern(ABC):
         return f"<{self.__class__.__name__} {self.lookup.value} {repr(self.value)}>"
 
     def __hash__(self):
-        return hash((self.__class__, self.lookup, self.value))
+        value = self.value
+        if isinstance(value, list):
+            # Hash given in-values as is, i.e. in order
+            value = tuple(value)
+        elif isinstance(value, set):
+            value = frozenset(value)
+        return hash((self.__class__, self.lookup, value))
+
+    @cached_property
+    def _hash(self) -> int:
+        # Pattern value is immutable once cleaned, only hash the pattern tree once
+        return hash(self)
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, Pattern):
+            return self._hash == other._hash
         return hash(self) == hash(other)
 
     def clean(self, value: Any) -> Any:
@@ -147,9 +177,33 @@ class Pattern(ABC):
     def strip_base(self, value: Any) -> Any:  # pragma: nocover
         return value
 
-    def match(self, request: httpx.Request) -> Match:
+    def exact_values(self) -> Optional[FrozenSet[Any]]:
+        """
+        Return the request values this pattern is restricted to,
+        or None if any value may match.
+        """
+        if self.base is None:
+            if self.lookup is Lookup.EQUAL:
+                return frozenset((self.value,))
+            elif self.lookup is Lookup.IN and not isinstance(self.value, str):
+                # A str value is matched by substring, and can't be indexed
+                return frozenset(self.value)
+        return None
+
+    def match(
+        self, request: httpx.Request, parsed: Optional[Dict[str, Any]] = None
+    ) -> Match:
+        """
+        Matches request, reusing and collecting shared parsed request values
+        in optional given dict, when matching many patterns with one request.
+        """
         try:
-            value = self.parse(request)
+            if parsed is None or not self.shared_parse:
+                value = self.parse(request)
+            elif self.key in parsed:
+                value = parsed[self.key]
+            else:
+                value = parsed[self.key] = self.parse(request)
         except Exception:
             return Match(False)
 
@@ -163,8 +217,7 @@ class Pattern(ABC):
         return self._match(value)
 
     def _match(self, value: Any) -> Match:
-        lookup_method = getattr(self, f"_{self.lookup.value}")
-        return lookup_method(value)
+        return self._lookup_method(value)
 
     def _eq(self, value: Any) -> Match:
         return Match(value == self.value)
@@ -182,7 +235,7 @@ class Pattern(ABC):
         raise NotImplementedError()
 
     def _in(self, value: Any) -> Match:
-        return Match(value in self.value)
+        return Match(value in self._in_values)
 
 
 class Noop(Pattern):
@@ -196,7 +249,9 @@ class Noop(Pattern):
         # Treat this pattern as non-existent, e.g. when filtering or conditioning
         return False
 
-    def match(self, request: httpx.Request) -> Match:
+    def match(
+        self, request: httpx.Request, parsed: Optional[Dict[str, Any]] = None
+    ) -> Match:
         # If this pattern is part of a combined pattern, always be truthy, i.e. noop
         return Match(True)
 
@@ -223,15 +278,20 @@ class _And(Pattern):
         yield from a
         yield from b
 
-    def match(self, request: httpx.Request) -> Match:
+    def match(
+        self, request: httpx.Request, parsed: Optional[Dict[str, Any]] = None
+    ) -> Match:
         a, b = self.value
-        a_match = a.match(request)
+        a_match = a.match(request, parsed)
         if not a_match:
             return a_match
-        b_match = b.match(request)
+        b_match = b.match(request, parsed)
         if not b_match:
             return b_match
-        return Match(True, **{**a_match.context, **b_match.context})
+        if b_match.context:
+            # Both matches are fresh, extend the first instead of re-building both
+            a_match.context.update(b_match.context)
+        return a_match
 
 
 class _Or(Pattern):
@@ -246,11 +306,13 @@ class _Or(Pattern):
         yield from a
         yield from b
 
-    def match(self, request: httpx.Request) -> Match:
+    def match(
+        self, request: httpx.Request, parsed: Optional[Dict[str, Any]] = None
+    ) -> Match:
         a, b = self.value
-        match = a.match(request)
+        match = a.match(request, parsed)
         if not match:
-            match = b.match(request)
+            match = b.match(request, parsed)
         return match
 
 
@@ -263,8 +325,10 @@ class _Invert(Pattern):
     def __iter__(self):
         yield from self.value
 
-    def match(self, request: httpx.Request) -> Match:
-        return ~self.value.match(request)
+    def match(
+        self, request: httpx.Request, parsed: Optional[Dict[str, Any]] = None
+    ) -> Match:
+        return ~self.value.match(request, parsed)
 
 
 class Method(Pattern):
@@ -273,11 +337,12 @@ class Method(Pattern):
     value: Union[str, Sequence[str]]
 
     def clean(self, value: Union[str, Sequence[str]]) -> Union[str, Sequence[str]]:
+        # Intern methods, shared by all method patterns and route index keys
         if isinstance(value, str):
-            value = value.upper()
+            value = sys.intern(value.upper())
         else:
             assert isinstance(value, Sequence)
-            value = tuple(v.upper() for v in value)
+            value = tuple(sys.intern(v.upper()) for v in value)
         return value
 
     def parse(self, request: httpx.Request) -> str:
@@ -291,34 +356,34 @@ class MultiItemsMixin:
     def _multi_items(
         self, value: Any, *, parse_any: bool = False
     ) -> Tuple[Tuple[str, Tuple[Any, ...]], ...]:
-        return tuple(
-            (
-                key,
-                tuple(
-                    ANY if parse_any and v == str(ANY) else v
-                    for v in value.get_list(key)
-                ),
-            )
-            for key in sorted(value.keys())
-        )
+        # Group values by key in a single pass, instead of a get_list() scan per key
+        items: Dict[str, List[Any]] = {key: [] for key in value.keys()}
+        if parse_any:
+            any_value = str(ANY)
+            for key, v in value.multi_items():
+                items[key].append(ANY if v == any_value else v)
+        else:
+            for key, v in value.multi_items():
+                items[key].append(v)
+        return tuple((key, tuple(items[key])) for key in sorted(items))
+
+    @cached_property
+    def _value_items(self) -> Tuple[Tuple[str, Tuple[Any, ...]], ...]:
+        # Pattern value is immutable once cleaned, only build its items once
+        return self._multi_items(self.value, parse_any=True)
 
     def __hash__(self):
-        return hash((self.__class__, self.lookup, self._multi_items(self.value)))
+        return hash((self.__class__, self.lookup, self._value_items))
 
     def _eq(self, value: Any) -> Match:
-        value_items = self._multi_items(self.value, parse_any=True)
         request_items = self._multi_items(value)
-        return Match(value_items == request_items)
+        return Match(self._value_items == request_items)
 
     def _contains(self, value: Any) -> Match:
-        if len(self.value.multi_items()) > len(value.multi_items()):
-            return Match(False)
+        request_items = dict(self._multi_items(value))
 
-        value_items = self._multi_items(self.value, parse_any=True)
-        request_items = self._multi_items(value)
-
-        for item in value_items:
-            if item not in request_items:
+        for key, values in self._value_items:
+            if request_items.get(key) != values:
                 return Match(False)
 
         return Match(True)
@@ -340,6 +405,7 @@ class Cookies(Pattern):
     key = "cookies"
     lookups = (Lookup.CONTAINS, Lookup.EQUAL)
     value: Set[Tuple[str, str]]
+    shared_parse = True
 
     def __hash__(self):
         return hash((self.__class__, self.lookup, tuple(sorted(self.value))))
@@ -350,19 +416,18 @@ class Cookies(Pattern):
 
         return set(value)
 
-    def parse(self, request: httpx.Request) -> Set[Tuple[str, str]]:
+    def parse(self, request: httpx.Request) -> FrozenSet[Tuple[str, str]]:
         headers = request.headers
 
         cookie_header = headers.get("cookie")
         if not cookie_header:
-            return set()
+            return frozenset()
 
         cookies: SimpleCookie = SimpleCookie()
         cookies.load(rawdata=cookie_header)
+        return frozenset((cookie.key, cookie.value) for cookie in cookies.values())
 
-        return {(cookie.key, cookie.value) for cookie in cookies.values()}
-
-    def _contains(self, value: Set[Tuple[str, str]]) -> Match:
+    def _contains(self, value: FrozenSet[Tuple[str, str]]) -> Match:
         return Match(bool(self.value & value))
 
 
@@ -420,17 +485,7 @@ class Path(Pattern):
         self, value: Union[str, RegexPattern[str]]
     ) -> Union[str, RegexPattern[str]]:
         if self.lookup in (Lookup.EQUAL, Lookup.STARTS_WITH) and isinstance(value, str):
-            # Percent encode path, i.e. revert parsed path by httpx.URL.
-            # Borrowed from HTTPX's "private" quote and percent_encode utilities.
-            path = "".join(
-                char
-                if char
-                in "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~/"
-                else "".join(f"%{byte:02x}" for byte in char.encode("utf-8")).upper()
-                for char in value
-            )
-            path = urljoin("/", path)  # Ensure leading slash
-            value = httpx.URL(path).path
+            value = _quote_path(value)
         elif self.lookup is Lookup.REGEX and isinstance(value, str):
             value = re.compile(value)
         return value
@@ -444,11 +499,33 @@ class Path(Pattern):
             value = "/" + value if not value.startswith("/") else value
         return value
 
+    def exact_values(self) -> Optional[FrozenSet[str]]:
+        if (
+            self.base is None
+            or self.base.lookup is not Lookup.STARTS_WITH
+            or self.lookup not in (Lookup.EQUAL, Lookup.IN)
+        ):
+            return super().exact_values()
+        elif self.lookup is Lookup.IN and isinstance(self.value, str):
+            return None
+
+        # Request paths that are stripped of base to any of the path values
+        base = self.base.value
+        values = (self.value,) if self.lookup is Lookup.EQUAL else self.value
+        paths = set()
+        for value in cast(Sequence[str], values):
+            if value.startswith("/"):
+                paths.add(base + value)
+                if not value.startswith("//"):
+                    paths.add(base + value[1:])
+        return frozenset(paths)
+
 
 class Params(MultiItemsMixin, Pattern):
     key = "params"
     lookups = (Lookup.CONTAINS, Lookup.EQUAL)
     value: httpx.QueryParams
+    shared_parse = True
 
     def clean(self, value: QueryParamTypes) -> httpx.QueryParams:
         return httpx.QueryParams(value)
@@ -466,30 +543,43 @@ class URL(Pattern):
         Lookup.STARTS_WITH,
     )
     value: Union[str, RegexPattern[str]]
+    shared_parse = True
 
     def clean(self, value: URLPatternTypes) -> Union[str, RegexPattern[str]]:
         url: Union[str, RegexPattern[str]]
         if self.lookup is Lookup.EQUAL and isinstance(value, (str, tuple, httpx.URL)):
-            _url = parse_url(value)
-            _url = self._ensure_path(_url)
-            url = str(_url)
+            url = self._ensure_path(parse_url(value))
         elif self.lookup is Lookup.REGEX and isinstance(value, str):
             url = re.compile(value)
-        elif isinstance(value, (str, RegexPattern)):
+        elif isinstance(value, (str, re.Pattern)):
             url = value
         else:
             raise ValueError(f"Invalid url: {value!r}")
         return url
 
+    def component_values(self, key: str) -> Optional[FrozenSet[str]]:
+        """
+        Return the request host or path values this url pattern is restricted to,
+        or None if any value may match.
+        """
+        if self.lookup is not Lookup.EQUAL or self.base is not None:
+            return None
+        url = _parse_url_string(cast(str, self.value))
+        if key == "host":
+            return frozenset((url.host,))
+        elif key == "path":
+            return frozenset((url.path,))
+        return None
+
     def parse(self, request: httpx.Request) -> str:
-        url = request.url
-        url = self._ensure_path(url)
-        return str(url)
+        return self._ensure_path(request.url)
 
-    def _ensure_path(self, url: httpx.URL) -> httpx.URL:
-        if not url._uri_reference.path:
-            url = url.copy_with(path="/")
-        return url
+    def _ensure_path(self, url: httpx.URL) -> str:
+        uri_reference = url._uri_reference
+        if not uri_reference.path:
+            # Replace empty path on the parsed reference, instead of re-parsing url
+            uri_reference = uri_reference._replace(path="/")
+        return str(uri_reference)
 
 
 class ContentMixin:
@@ -520,14 +610,18 @@ class JSON(ContentMixin, PathPattern):
     def clean(self, value: Union[str, List, Dict]) -> str:
         return self.hash(value)
 
+    @cached_property
+    def _path_keys(self) -> Tuple[Union[int, str], ...]:
+        bits = self.path.split("__") if self.path else ()
+        return tuple(int(bit) if bit.isdigit() else bit for bit in bits)
+
     def parse(self, request: httpx.Request) -> str:
         content = super().parse(request)
         json = jsonlib.loads(content.decode("utf-8"))
 
         if self.path:
             value = json
-            for bit in self.path.split("__"):
-                key = int(bit) if bit.isdigit() else bit
+            for key in self._path_keys:
                 try:
                     value = value[key]
                 except KeyError as e:
@@ -604,6 +698,33 @@ class Files(MultiItemsMixin, Pattern):
         return files
 
 
+@lru_cache(maxsize=1024)
+def parse_lookup_key(
+    pattern__lookup: str,
+) -> Tuple[Type[Pattern], Optional[Lookup], str]:
+    """
+    Parses a pattern lookup keyword, e.g. `path__regex` or `json__foo__bar`,
+    and returns its pattern class, optional lookup and optional path.
+    """
+    pattern_key, __, rest = pattern__lookup.partition("__")
+    path, __, lookup_name = rest.rpartition("__")
+    if pattern_key not in Pattern.registry:
+        raise KeyError(f"{pattern_key!r} is not a valid Pattern")
+
+    P = Pattern.registry[pattern_key]
+    if issubclass(P, PathPattern):
+        # Path supported pattern, i.e. JSON, where last part may be a path bit
+        try:
+            lookup = Lookup(lookup_name) if lookup_name else None
+        except ValueError:
+            lookup = None
+            path = rest
+    else:
+        lookup = Lookup(lookup_name) if lookup_name else None
+
+    return P, lookup, path
+
+
 def M(*patterns: Pattern, **lookups: Any) -> Pattern:
     extras = None
 
@@ -613,27 +734,15 @@ def M(*patterns: Pattern, **lookups: Any) -> Pattern:
             extras = parse_url_patterns(value)
             continue
 
-        # Parse pattern key and lookup
-        pattern_key, __, rest = pattern__lookup.partition("__")
-        path, __, lookup_name = rest.rpartition("__")
-        if pattern_key not in Pattern.registry:
-            raise KeyError(f"{pattern_key!r} is not a valid Pattern")
-
-        # Get pattern class
-        P = Pattern.registry[pattern_key]
+        # Get pattern class and lookup
+        P, lookup, path = parse_lookup_key(pattern__lookup)
         pattern: Union[Pattern, PathPattern]
 
         if issubclass(P, PathPattern):
             # Make path supported pattern, i.e. JSON
-            try:
-                lookup = Lookup(lookup_name) if lookup_name else None
-            except ValueError:
-                lookup = None
-                path = rest
             pattern = P(value, lookup=lookup, path=path)
         else:
             # Make regular pattern
-            lookup = Lookup(lookup_name) if lookup_name else None
             pattern = P(value, lookup=lookup)
 
         # Skip patterns with no value, exept when using equal lookup
@@ -650,8 +759,11 @@ def M(*patterns: Pattern, **lookups: Any) -> Pattern:
     return combined_pattern
 
 
+SCHEME_PORTS: Dict[str, int] = {"http": 80, "https": 443}
+
+
 def get_scheme_port(scheme: Optional[str]) -> Optional[int]:
-    return {"http": 80, "https": 443}.get(scheme or "")
+    return SCHEME_PORTS.get(scheme or "")
 
 
 def combine(patterns: Sequence[Pattern], op: Callable = operator.and_) -> Pattern:
@@ -661,6 +773,66 @@ def combine(patterns: Sequence[Pattern], op: Callable = operator.and_) -> Patter
     return reduce(op, patterns)
 
 
+def get_values(pattern: Pattern, key: str) -> Optional[FrozenSet[Any]]:
+    """
+    Returns the request values given pattern is restricted to, for given
+    pattern key, or None if any value may match.
+    """
+    if isinstance(pattern, _And):
+        a, b = pattern.value
+        a_values, b_values = get_values(a, key), get_values(b, key)
+        if a_values is None:
+            return b_values
+        elif b_values is None:
+            return a_values
+        return a_values & b_values
+
+    elif getattr(pattern, "key", None) == key:
+        return pattern.exact_values()
+
+    elif isinstance(pattern, URL):
+        return pattern.component_values(key)
+
+    return None
+
+
+def strip_values(pattern: Pattern, *keys: str) -> Pattern:
+    """
+    Returns given pattern without the equal and in lookups for given pattern
+    keys, i.e. what is left to match when a request is known to match them.
+    """
+    if isinstance(pattern, _And):
+        a, b = pattern.value
+        return strip_values(a, *keys) & strip_values(b, *keys)
+
+    elif getattr(pattern, "key", None) in keys and pattern.exact_values() is not None:
+        return Noop()
+
+    return pattern
+
+
+@lru_cache(maxsize=4096)
+def _quote_path(value: str) -> str:
+    """
+    Percent encode path, i.e. revert parsed path by httpx.URL.
+    Borrowed from HTTPX's "private" quote and percent_encode utilities.
+    """
+    path = "".join(
+        char
+        if char in "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~/"
+        else "".join(f"%{byte:02x}" for byte in char.encode("utf-8")).upper()
+        for char in value
+    )
+    path = urljoin("/", path)  # Ensure leading slash
+    return httpx.URL(path).path
+
+
+@lru_cache(maxsize=4096)
+def _parse_url_string(value: str) -> httpx.URL:
+    # URLs are immutable, re-use parsed urls when registering the same url again
+    return httpx.URL(value)
+
+
 def parse_url(value: Union[httpx.URL, str, RawURL]) -> httpx.URL:
     url: Union[httpx.URL, str]
 
@@ -680,6 +852,8 @@ def parse_url(value: Union[httpx.URL, str, RawURL]) -> httpx.URL:
     else:
         url = value
 
+    if isinstance(url, str):
+        return _parse_url_string(url)
     return httpx.URL(url)
 
 
@@ -690,7 +864,7 @@ def parse_url_patterns(
     if not url or url == "all":
         return bases
 
-    if isinstance(url, RegexPattern):
+    if isinstance(url, re.Pattern):
         return {"url": URL(url, lookup=Lookup.REGEX)}
 
     url = parse_url(url)
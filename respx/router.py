@@ -1,12 +1,10 @@
 import inspect
-from contextlib import contextmanager
-from functools import partial, update_wrapper, wraps
+from functools import partial, update_wrapper
 from types import TracebackType
 from typing import (
     Any,
     Callable,
     Dict,
-    Generator,
     List,
     NewType,
     Optional,
@@ -36,6 +34,64 @@ Default = NewType("Default", object)
 DEFAULT = Default(...)
 
 
+class Resolver:
+    """
+    Context manager resolving a request to a route and response,
+    recording the call on exit.
+
+    Used on every mocked request, hence a plain class instead of a
+    generator based context manager.
+    """
+
+    __slots__ = ("router", "request", "resolved")
+
+    def __init__(self, router: "Router", request: httpx.Request) -> None:
+        self.router = router
+        self.request = request
+        self.resolved = ResolvedRoute()
+
+    def __enter__(self) -> ResolvedRoute:
+        return self.resolved
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        router, request, resolved = self.router, self.request, self.resolved
+
+        if isinstance(exc_value, SideEffectError):
+            router.record(request, response=None, route=exc_value.route)
+            raise exc_value.origin from exc_value
+
+        if exc_value is not None:
+            return
+
+        if resolved.route is None:
+            # Assert we always get a route match, if check is enabled
+            if router._assert_all_mocked:
+                raise AllMockedAssertionError(f"RESPX: {request!r} not mocked!")
+
+            # Auto mock a successful empty response
+            resolved.response = httpx.Response(200)
+
+        elif resolved.response == request:
+            # Pass-through request
+            router.record(request, response=None, route=resolved.route)
+            raise PassThrough(
+                f"Request marked to pass through: {request!r}",
+                request=request,
+                origin=resolved.route,
+            )
+
+        else:
+            # Mocked response
+            assert isinstance(resolved.response, httpx.Response)
+
+        router.record(request, response=resolved.response, route=resolved.route)
+
+
 class Router:
     def __init__(
         self,
@@ -80,15 +136,16 @@ class Router:
         if not self._snapshots:
             return
 
-        # Revert added routes and calls to last snapshot
         routes, calls = self._snapshots.pop()
-        self.routes[:] = routes
-        self.calls[:] = calls
 
-        # Revert each route state to last snapshot
-        for route in self.routes:
+        # Revert each route state to last snapshot, before re-indexing routes
+        for route in routes:
             route.rollback()
 
+        # Revert added routes and calls to last snapshot
+        self.routes[:] = routes
+        self.calls[:] = calls
+
     def reset(self) -> None:
         """
         Resets call stats.
@@ -118,12 +175,7 @@ class Router:
 
         Raises KeyError when `default` not provided and name is not found.
         """
-        try:
-            return self.routes.pop(name)
-        except KeyError as ex:
-            if default is ...:
-                raise ex
-            return default
+        return self.routes.pop(name, default)
 
     def route(
         self, *patterns: Pattern, name: Optional[str] = None, **lookups: Any
@@ -161,7 +213,9 @@ class Router:
             elif url and "url" in pattern_keys:
                 raise TypeError("Got multiple values for pattern 'url'")
 
-        return self.route(method=method, url=url, name=name, **lookups)
+        # Build route directly, instead of re-packing lookups through route()
+        route = Route(method=method, url=url, **lookups)
+        return self.add(route, name=name)
 
     def get(
         self,
@@ -237,46 +291,15 @@ class Router:
         if route:
             route.calls.append(call)
 
-    @contextmanager
-    def resolver(self, request: httpx.Request) -> Generator[ResolvedRoute, None, None]:
-        resolved = ResolvedRoute()
-
-        try:
-            yield resolved
-
-            if resolved.route is None:
-                # Assert we always get a route match, if check is enabled
-                if self._assert_all_mocked:
-                    raise AllMockedAssertionError(f"RESPX: {request!r} not mocked!")
-
-                # Auto mock a successful empty response
-                resolved.response = httpx.Response(200)
-
-            elif resolved.response == request:
-                # Pass-through request
-                raise PassThrough(
-                    f"Request marked to pass through: {request!r}",
-                    request=request,
-                    origin=resolved.route,
-                )
-
-            else:
-                # Mocked response
-                assert isinstance(resolved.response, httpx.Response)
-
-        except SideEffectError as error:
-            self.record(request, response=None, route=error.route)
-            raise error.origin from error
-        except PassThrough:
-            self.record(request, response=None, route=resolved.route)
-            raise
-        else:
-            self.record(request, response=resolved.response, route=resolved.route)
+    def resolver(self, request: httpx.Request) -> "Resolver":
+        return Resolver(self, request)
 
     def resolve(self, request: httpx.Request) -> ResolvedRoute:
         with self.resolver(request) as resolved:
-            for route in self.routes:
-                prospect = route.match(request)
+            # Request values parsed once, and shared by the patterns of all routes
+            parsed: Dict[str, Any] = {}
+            for route, pattern in self.routes.for_request(request):
+                prospect = route._match(request, pattern, parsed)
                 if prospect is not None:
                     resolved.route = route
                     resolved.response = cast(ResolvedResponseTypes, prospect)
@@ -289,11 +312,13 @@ class Router:
 
     async def aresolve(self, request: httpx.Request) -> ResolvedRoute:
         with self.resolver(request) as resolved:
-            for route in self.routes:
-                prospect: RouteResultTypes = route.match(request)
+            # Request values parsed once, and shared by the patterns of all routes
+            parsed: Dict[str, Any] = {}
+            for route, pattern in self.routes.for_request(request):
+                prospect: RouteResultTypes = route._match(request, pattern, parsed)
 
                 # Await async side effect and wrap any exception
-                if inspect.isawaitable(prospect):
+                if prospect is not None and inspect.isawaitable(prospect):
                     try:
                         prospect = await prospect
                     except Exception as error:
@@ -412,17 +437,11 @@ class MockRouter(Router):
             with self:
                 return func(*args, **kwargs)
 
-        if needs_mock_reference:
-            async_decorator = wraps(func)(_async_decorator)
-            sync_decorator = wraps(func)(_sync_decorator)
-        else:
-            async_decorator = update_wrapper(_async_decorator, func)
-            sync_decorator = update_wrapper(_sync_decorator, func)
-
         # Dispatch async/sync decorator, depending on decorated function.
         # - Only stage when using global decorator `@respx.mock`
         # - Second stage when using local decorator `@respx.mock(...)`
-        return async_decorator if is_async else sync_decorator
+        decorator = _async_decorator if is_async else _sync_decorator
+        return update_wrapper(decorator, func)
 
     def __enter__(self) -> "MockRouter":
         self.start()
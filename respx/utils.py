@@ -23,13 +23,13 @@ import httpx
 
 class MultiItems(defaultdict):
     def __init__(self, values: Optional[Iterable[Tuple[str, Any]]] = None) -> None:
-        super().__init__(tuple)
+        super().__init__(list)
         if values is not None:
             for key, value in values:
                 if isinstance(value, (tuple, list)):
-                    self[key] += tuple(value)  # Convert list to tuple and extend
+                    self[key].extend(value)
                 else:
-                    self[key] += (value,)  # Extend with value
+                    self[key].append(value)
 
     def get_list(self, key: str) -> List[Any]:
         return list(self[key])
@@ -38,18 +38,17 @@ class MultiItems(defaultdict):
         return [(key, value) for key, values in self.items() for value in values]
 
     def append(self, key: str, value: Any) -> None:
-        self[key] += (value,)
+        self[key].append(value)
+
+
+_MIME_HEADER = b"MIME-Version: 1.0\r\nContent-Type: "
 
 
 def _parse_multipart_form_data(
     content: bytes, *, content_type: str, encoding: str
 ) -> Tuple[MultiItems, MultiItems]:
-    form_data = b"\r\n".join(
-        (
-            b"MIME-Version: 1.0",
-            b"Content-Type: " + content_type.encode(encoding),
-            b"\r\n" + content,
-        )
+    form_data = b"".join(
+        (_MIME_HEADER, content_type.encode(encoding), b"\r\n\r\n", content)
     )
     data = MultiItems()
     files = MultiItems()
@@ -477,6 +477,20 @@ def test_pop():
         assert respx.pop("foobar", "custom default") == "custom default"
 
 
+def test_module_level_routes_and_calls():
+    with respx.mock:
+        respx.get("https://foo.bar/") % 204
+        httpx.get("https://foo.bar/")
+        assert respx.calls.call_count == 1
+        respx.reset()
+
+    # Module level routes and calls are never rebound, only mutated in place
+    assert respx.routes is respx.mock.routes
+    assert respx.calls is respx.mock.calls
+    assert not respx.routes
+    assert not respx.calls
+
+
 @respx.mock
 @pytest.mark.parametrize(
     ("url", "params", "call_url", "call_params"),
@@ -564,6 +578,22 @@ def test_respond():
             route.respond(content=Exception())  # type: ignore[arg-type]
 
 
+def test_shared_response():
+    response = httpx.Response(200, json={"foo": "bar"})
+    with respx.mock:
+        foo_route = respx.get("https://foo.bar/").mock(return_value=response)
+        ham_route = respx.get("https://ham.spam/") % response
+
+        foo_response = httpx.get("https://foo.bar/")
+        ham_response = httpx.get("https://ham.spam/")
+        assert foo_response is not response
+        assert ham_response is not response
+        assert foo_response.request.url == "https://foo.bar/"
+        assert ham_response.request.url == "https://ham.spam/"
+        assert foo_response.json() == ham_response.json() == {"foo": "bar"}
+        assert foo_route.return_value is ham_route.return_value is response
+
+
 def test_can_respond_with_cookies():
     with respx.mock:
         route = respx.get("https://foo.bar/").respond(
@@ -1,4 +1,7 @@
+import sys
+import types
 from contextlib import ExitStack as does_not_raise
+from typing import Any
 
 import httpcore
 import httpx
@@ -473,6 +476,103 @@ def test_add_remove_targets():
         assert len(HTTPCoreMocker.targets) == pre_add_count
 
 
+@pytest.fixture
+def unpatched_httpcore():
+    from respx.mocks import HTTPCoreMocker
+
+    # Detach any session mocked routers, to start from unpatched targets
+    routers = HTTPCoreMocker.routers[:]
+    HTTPCoreMocker.routers.clear()
+    HTTPCoreMocker.stop(force=True)
+    try:
+        yield HTTPCoreMocker
+    finally:
+        # Re-patch for any detached routers, stop is a no-op when there are some
+        HTTPCoreMocker.routers[:] = routers
+        HTTPCoreMocker.start()
+        HTTPCoreMocker.stop()
+
+
+def test_inherited_target(unpatched_httpcore):
+    # HTTPProxy inherits its request handlers from ConnectionPool
+    original = httpcore.ConnectionPool.handle_request
+    assert "handle_request" not in vars(httpcore.HTTPProxy)
+    assert "handle_async_request" not in vars(httpcore.AsyncHTTPProxy)
+
+    for _ in range(2):
+        with respx.mock(using="httpcore"):
+            assert "handle_request" in vars(httpcore.HTTPProxy)
+            with respx.mock(using="httpcore"):
+                assert "handle_request" in vars(httpcore.HTTPProxy)
+            assert "handle_request" in vars(httpcore.HTTPProxy)
+
+        assert "handle_request" not in vars(httpcore.HTTPProxy)
+        assert "handle_async_request" not in vars(httpcore.AsyncHTTPProxy)
+        assert httpcore.HTTPProxy.handle_request is original
+        assert httpcore.ConnectionPool.handle_request is original
+
+
+def test_slotted_target(unpatched_httpcore, monkeypatch):
+    class SlottedTransport:
+        __slots__ = ("handle_request",)
+        handle_request: Any
+
+    def handle_request(request):  # pragma: nocover
+        raise NotImplementedError()
+
+    transport = SlottedTransport()
+    transport.handle_request = handle_request
+    module = types.ModuleType("slotted_module")
+    setattr(module, "transport", transport)
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    monkeypatch.setattr(unpatched_httpcore, "targets", ["slotted_module.transport"])
+
+    with respx.mock(using="httpcore"):
+        assert transport.handle_request is not handle_request
+    assert transport.handle_request is handle_request
+
+
+def test_unknown_target_module(unpatched_httpcore, monkeypatch):
+    # Patched targets are undone when start fails on an unknown target module
+    target = "foobar_module.FoobarTransport"
+    original = httpcore.ConnectionPool.handle_request
+    monkeypatch.setattr(
+        unpatched_httpcore, "targets", [*unpatched_httpcore.targets, target]
+    )
+    with pytest.raises(ModuleNotFoundError, match="foobar_module"):
+        unpatched_httpcore.start()
+    assert not unpatched_httpcore._patches
+    assert httpcore.ConnectionPool.handle_request is original
+
+
+def test_resolve_target():
+    from respx.mocks import _resolve_target
+
+    assert _resolve_target("httpx.Client") is httpx.Client
+    assert _resolve_target("httpx._client.Client.send") is httpx.Client.send
+    with pytest.raises(AttributeError):
+        _resolve_target("httpx.FoobarTransport")
+    with pytest.raises(ModuleNotFoundError, match="foobar_module"):
+        _resolve_target("foobar_module.FoobarTransport")
+
+
+def test_missing_target():
+    from respx.mocks import HTTPCoreMocker
+
+    HTTPCoreMocker.add_targets("httpcore.FoobarTransport")
+    try:
+        with respx.mock(using="httpcore") as respx_mock:
+            respx_mock.get("https://foo.bar/") % 204
+            response = httpx.get("https://foo.bar/")
+            assert response.status_code == 204
+    finally:
+        HTTPCoreMocker.remove_targets("httpcore.FoobarTransport")
+
+    with pytest.raises(ModuleNotFoundError, match="foobar_module"):
+        HTTPCoreMocker.add_targets("foobar_module.FoobarTransport")
+    assert "foobar_module.FoobarTransport" not in HTTPCoreMocker.targets
+
+
 async def test_proxies():
     with respx.mock:
         respx.get("https://foo.bar/") % dict(json={"foo": "bar"})
@@ -564,6 +664,9 @@ def test_sync_httpx_mocker():
             with pytest.raises(AllMockedAssertionError):
                 client.get("https://not-mocked/")
 
+            url = httpx.URL("https://example.org/")
+            assert client._transport_for_url(url) is client._transport_for_url(url)
+
     with respx.mock(using="httpx"):  # extra registered router
         test()
 
@@ -1,5 +1,6 @@
 import io
 import re
+from typing import Any, Dict
 from unittest.mock import ANY
 
 import httpx
@@ -23,8 +24,10 @@ from respx.patterns import (
     Pattern,
     Port,
     Scheme,
+    get_values,
     merge_patterns,
     parse_url_patterns,
+    strip_values,
 )
 
 
@@ -150,6 +153,20 @@ def test_cookies_pattern__hash():
     assert Cookies({"x": "1", "y": "2"}) == Cookies({"y": "2", "x": "1"})
 
 
+def test_cookies_pattern__parse():
+    request = httpx.Request("GET", "http://foo.bar/", cookies={"x": "1", "y": "2"})
+    pattern = Cookies({"x": "1"}, lookup=Lookup.CONTAINS)
+    assert pattern.parse(request) == {("x", "1"), ("y", "2")}
+
+    parsed: Dict[str, Any] = {}
+    assert pattern.match(request, parsed)
+    assert parsed == {"cookies": {("x", "1"), ("y", "2")}}
+    assert Cookies({"y": "2"}, lookup=Lookup.CONTAINS).match(request, parsed)
+
+    # Shared parsed cookies are reused, instead of parsing request again
+    assert not pattern.match(request, {"cookies": frozenset()})
+
+
 @pytest.mark.parametrize(
     ("lookup", "scheme", "expected"),
     [
@@ -218,6 +235,10 @@ def test_path_pattern():
 
     request = httpx.Request("GET", "https://foo.bar/baz/")
     assert Path(["/egg/", "/baz/"], lookup=Lookup.IN).match(request)
+    assert Path(["/egg/", "/baz/"], lookup=Lookup.IN) == M(path__in=["/egg/", "/baz/"])
+    assert Path(["/egg/", "/baz/"], lookup=Lookup.IN) != M(path__in=["/baz/", "/egg/"])
+    assert Path({"/egg/", "/baz/"}, lookup=Lookup.IN) == M(path__in={"/baz/", "/egg/"})
+    assert M(path__in=["/egg/", "/baz/"]).value == ["/egg/", "/baz/"]
 
     path = Path("/bar/")
     assert path.strip_base("/foo/bar/") == "/foo/bar/"
@@ -268,6 +289,21 @@ def test_params_pattern_hash():
     assert Params("x=1&y=2") == Params("y=2&x=1")
 
 
+def test_params_pattern_parse():
+    request = httpx.Request("GET", "https://foo.bar/?x=1&y=2")
+    pattern = Params("x=1", Lookup.CONTAINS)
+    other_pattern = Params("y=2", Lookup.CONTAINS)
+    assert pattern.parse(request) == httpx.QueryParams("x=1&y=2")
+
+    parsed: Dict[str, Any] = {}
+    assert pattern.match(request, parsed)
+    assert parsed == {"params": httpx.QueryParams("x=1&y=2")}
+    assert other_pattern.match(request, parsed)
+
+    # Shared parsed params are reused, instead of parsing request again
+    assert not pattern.match(request, {"params": httpx.QueryParams("x=2")})
+
+
 @pytest.mark.parametrize(
     ("lookup", "value", "context", "url", "expected"),
     [
@@ -296,6 +332,25 @@ def test_url_pattern(lookup, value, context, url, expected):
     assert match.context == context
 
 
+def test_url_pattern_parse():
+    request = httpx.Request("GET", "https://foo.bar?x=1")
+    pattern = URL("https://foo.bar/?x=1")
+    regex_pattern = URL(r"^https://foo\.bar/", Lookup.REGEX)
+    assert pattern.parse(request) == "https://foo.bar/?x=1"
+
+    parsed: Dict[str, Any] = {}
+    assert pattern.match(request, parsed)
+    assert parsed == {"url": "https://foo.bar/?x=1"}
+    assert regex_pattern.match(request, parsed)
+
+    # Shared parsed url is reused, instead of parsing request again
+    parsed = {"url": "https://ham.spam/egg/"}
+    assert not pattern.match(request, parsed)
+    assert not (M(method="GET") & regex_pattern).match(request, parsed)
+    assert not (M(method="POST") | regex_pattern).match(request, parsed)
+    assert (~regex_pattern).match(request, parsed)
+
+
 def test_url_pattern_invalid():
     with pytest.raises(ValueError, match="Invalid"):
         URL(["invalid"])
@@ -658,6 +713,110 @@ def test_merge_patterns():
     assert any(tuple(p.base == base for p in iter(merged_pattern)))
 
 
+@pytest.mark.parametrize(
+    ("pattern", "key", "expected"),
+    [
+        (Noop(), "method", None),
+        (Host("foo.bar"), "method", None),
+        (Method("get"), "method", {"GET"}),
+        (M(method__in=["GET", "POST"]), "method", {"GET", "POST"}),
+        (M(url="https://foo.bar/", method="GET"), "method", {"GET"}),
+        (Host("foo.bar") & Method("GET"), "method", {"GET"}),
+        (M(method__in=["GET", "POST"]) & Method("POST"), "method", {"POST"}),
+        (Method("GET") | Method("POST"), "method", None),
+        (~Method("GET"), "method", None),
+        (M(url="https://foo.bar/baz/", method="GET"), "host", {"foo.bar"}),
+        (M(url="https://foo.bar/baz/", method="GET"), "path", {"/baz/"}),
+        (M(host__regex=r"foo\.bar"), "host", None),
+        (M(path__startswith="/baz/"), "path", None),
+        (M(path__in=["/foo/", "/bar/"]), "path", {"/foo/", "/bar/"}),
+        (M(method__in="GET"), "method", None),
+        (M(host__in="example.com"), "host", None),
+        (M(url__eq="https://foo.bar/baz/?x=1"), "host", {"foo.bar"}),
+        (M(url__eq="https://foo.bar/baz/?x=1"), "path", {"/baz/"}),
+        (M(url__eq="https://foo.bar/baz/?x=1"), "method", None),
+        (M(url__eq="https://foo.bar"), "path", {"/"}),
+        (M(url__startswith="https://foo.bar/baz/"), "host", None),
+        (
+            merge_patterns(Path("/baz/"), path=Path("/api/", Lookup.STARTS_WITH)),
+            "path",
+            {"/api/baz/", "/api//baz/"},
+        ),
+        (
+            merge_patterns(
+                M(path__in=["/", "//baz/", "baz"]),
+                path=Path("/api", Lookup.STARTS_WITH),
+            ),
+            "path",
+            {"/api/", "/api", "/api//baz/"},
+        ),
+        (
+            merge_patterns(
+                M(path__regex=r"/\w+/"), path=Path("/api/", Lookup.STARTS_WITH)
+            ),
+            "path",
+            None,
+        ),
+        (
+            merge_patterns(Path("/baz/"), path=Path(r"/\w+/", Lookup.REGEX)),
+            "path",
+            None,
+        ),
+    ],
+)
+def test_get_values(pattern, key, expected):
+    values = get_values(pattern, key)
+    assert values == (None if expected is None else frozenset(expected))
+
+
+@pytest.mark.parametrize(
+    ("pattern", "keys", "expected"),
+    [
+        (Noop(), ("method",), Noop()),
+        (Method("GET"), ("method",), Noop()),
+        (Method("GET"), ("host",), None),
+        (M(method__in=["GET", "POST"]), ("method",), Noop()),
+        (
+            M(url="https://foo.bar/baz/", method="GET"),
+            ("method", "host", "path"),
+            Scheme("https"),
+        ),
+        (
+            M(host="foo.bar", path__regex=r"/\w+/"),
+            ("host",),
+            Path(r"/\w+/", Lookup.REGEX),
+        ),
+        (Method("GET") | Method("POST"), ("method",), None),
+        (~Method("GET"), ("method",), None),
+        (M(host__regex=r"foo\.bar"), ("host",), None),
+        (M(url__eq="https://foo.bar/baz/"), ("host", "path"), None),
+        (M(method__in="GET"), ("method",), None),
+        (M(host__in="example.com"), ("host",), None),
+        (
+            M(method__in="GET", host__in="example.com"),
+            ("method", "host"),
+            M(method__in="GET", host__in="example.com"),
+        ),
+        (
+            merge_patterns(Path("/baz/"), path=Path("/api/", Lookup.STARTS_WITH)),
+            ("path",),
+            Noop(),
+        ),
+        (
+            merge_patterns(Path("/baz/"), path=Path(r"/\w+/", Lookup.REGEX)),
+            ("path",),
+            None,
+        ),
+    ],
+)
+def test_strip_values(pattern, keys, expected):
+    stripped = strip_values(pattern, *keys)
+    if expected is None:
+        assert stripped is pattern
+    else:
+        assert stripped == expected
+
+
 def test_unique_pattern_key():
     with pytest.raises(TypeError, match="unique key"):
 
@@ -6,7 +6,7 @@ import pytest
 
 from respx import Route, Router
 from respx.models import AllMockedAssertionError, PassThrough, RouteList
-from respx.patterns import Host, M, Method
+from respx.patterns import URL, Host, M, Method
 
 
 async def test_empty_router():
@@ -50,6 +50,8 @@ async def test_empty_router__auto_mocked():
         (tuple(), dict(headers={"Content-Type": "text/plain"}), False),
         (tuple(), dict(headers={"cookie": "foo=bar"}), False),
         (tuple(), dict(cookies={"ham": "spam"}), True),
+        (tuple(), dict(method__in="GET", url="https://foo.bar/baz/"), True),
+        (tuple(), dict(host__in="foo.bar"), True),
     ],
 )
 def test_resolve(args, kwargs, expected):
@@ -69,6 +71,158 @@ def test_resolve(args, kwargs, expected):
         assert resolved.response.status_code == 200  # auto mocked
 
 
+def test_resolve_by_index():
+    router = Router(assert_all_mocked=False)
+    router.route(host="foo.bar", name="any").respond(418)
+    router.get("https://foo.bar/", name="get").respond(200)
+    router.post("https://foo.bar/", name="post").respond(201)
+    router.post(path__in=["/", "/baz/"], name="path").respond(202)
+    router.post(host__in=["foo.bar", "ham.spam"], path="/", name="host").respond(203)
+
+    def resolve(method, url):
+        route = router.resolve(httpx.Request(method, url)).route
+        return route.name if route else None
+
+    def resolve_all():
+        return [
+            resolve(method, url)
+            for method in ("GET", "POST", "PUT")
+            for url in (
+                "https://foo.bar/",
+                "https://foo.bar/baz/",
+                "https://ham.spam/",
+                "https://ham.spam/baz/",
+            )
+        ]
+
+    # GET, POST and PUT for foo.bar/, foo.bar/baz/, ham.spam/ and ham.spam/baz/
+    all_routes = [
+        *("any", "any", None, None),
+        *("any", "any", "path", "path"),
+        *("any", "any", None, None),
+    ]
+    assert resolve_all() == all_routes
+
+    request = httpx.Request("POST", "https://foo.bar/")
+    assert router["get"].match(request) is None
+    assert isinstance(router["post"].match(request), httpx.Response)
+
+    # Remove routes in order, revealing the next matching route
+    router.snapshot()
+    router.pop("any")
+    assert resolve_all() == [
+        *("get", None, None, None),
+        *("post", "path", "path", "path"),
+        *(None, None, None, None),
+    ]
+    router.pop("post")
+    router.pop("path")
+    assert resolve_all() == [
+        *("get", None, None, None),
+        *("host", None, "host", None),
+        *(None, None, None, None),
+    ]
+
+    # Re-set route by name, with a new pattern
+    router.put("https://ham.spam/baz/", name="host")
+    assert resolve_all() == [
+        *("get", None, None, None),
+        *(None, None, None, None),
+        *(None, None, None, "host"),
+    ]
+
+    # Add route after routes with an exact host and path
+    router.route(host__regex=r"^(foo\.bar|ham\.spam)$", name="regex")
+    assert resolve_all() == [
+        *("get", "regex", "regex", "regex"),
+        *("regex", "regex", "regex", "regex"),
+        *("regex", "regex", "regex", "host"),
+    ]
+
+    router.rollback()
+    assert resolve_all() == all_routes
+
+    routes = RouteList(router.routes)
+    router.clear()
+    assert resolve_all() == [None] * 12
+    router.routes[:] = routes
+    assert resolve_all() == all_routes
+
+    # Resolve many distinct requests, beyond any caching of candidate routes
+    for i in range(1000):
+        assert resolve("PUT", f"https://ham.spam/{i}/") is None
+    assert resolve_all() == all_routes
+
+
+def test_in_lookup_routes():
+    router = Router(assert_all_mocked=False)
+    route_1 = router.get(host__in=["foo.bar", "ham.spam"]).respond(201)
+    route_2 = router.get(host__in=["ham.spam", "foo.bar"]).respond(202)
+    assert route_1 is not route_2
+    assert list(router.routes) == [route_1, route_2]
+
+    # Same in-values, in the same order, replaces the existing route
+    route_3 = router.get(host__in=["ham.spam", "foo.bar"]).respond(203)
+    assert route_3 is route_2
+    assert list(router.routes) == [route_1, route_2]
+
+    request = httpx.Request("GET", "https://ham.spam/")
+    assert router.resolve(request).route is route_1
+
+
+def test_custom_route_attributes():
+    router = Router(assert_all_mocked=False)
+    route = router.get("https://foo.bar/")
+    route.tag = "foobar"  # type: ignore[attr-defined]
+    assert router.routes[0].tag == "foobar"  # type: ignore[attr-defined]
+
+
+def test_resolve_by_index__unindexable_values():
+    router = Router(assert_all_mocked=False)
+    host_route = router.get(host__in=["foo.bar", 1]).respond(201)
+    path_route = router.get(host="ham.spam", path__in=["/baz/", 1]).respond(202)
+
+    url_route = router.get("https://ham.spam/baz/").respond(203)
+
+    def resolve(url):
+        return router.resolve(httpx.Request("GET", url)).route
+
+    assert resolve("https://foo.bar/") is host_route
+    assert resolve("https://foo.bar/baz/") is host_route
+    assert resolve("https://ham.spam/") is None
+    assert resolve("https://ham.spam/baz/") is path_route
+    assert resolve("https://ham.spam/egg/") is None
+
+    router.routes[:] = RouteList()
+    router.add(url_route)
+    router.add(path_route)
+    assert resolve("https://ham.spam/baz/") is url_route
+
+
+async def test_resolve__shared_parse(monkeypatch):
+    parse = URL.parse
+    parsed_requests = []
+
+    def counting_parse(self, request):
+        parsed_requests.append(request)
+        return parse(self, request)
+
+    monkeypatch.setattr(URL, "parse", counting_parse)
+
+    router = Router(assert_all_mocked=False)
+    router.route(url__regex=r"^https://foo\.bar/a/")
+    router.route(url__startswith="https://foo.bar/b/")
+    route = router.route(url__regex=r"^https://foo\.bar/")
+
+    request = httpx.Request("GET", "https://foo.bar/c/")
+    assert router.resolve(request).route is route
+    assert parsed_requests == [request]
+
+    request = httpx.Request("GET", "https://foo.bar/c/")
+    assert (await router.aresolve(request)).route is route
+    assert parsed_requests[1:] == [request]
+
+
 def test_pass_through():
     router = Router(assert_all_mocked=False)
     route = router.get("https://foo.bar/", path="/baz/").pass_through()
@@ -94,6 +248,9 @@ def test_pass_through():
     [
         ("https://foo.bar/api/baz/", {"url": "/baz/"}, True),
         ("https://foo.bar/api/baz/", {"path__regex": r"^/(?P<slug>\w+)/$"}, True),
+        ("https://foo.bar/baz/", {"path__regex": r"^/(?P<slug>\w+)/$"}, False),
+        ("https://foo.bar/api//baz/", {"url": "/baz/"}, True),
+        ("https://foo.bar/api/baz/", {"path__in": "/baz/"}, True),
         ("http://foo.bar/api/baz/", {"url": "/baz/"}, False),
         ("https://ham.spam/api/baz/", {"url": "/baz/"}, False),
         ("https://foo.bar/baz/", {"url": "/baz/"}, False),
@@ -176,6 +333,22 @@ def test_mod_response():
         router.route() % []  # type: ignore[operator]
 
 
+async def test_cloned_response_content():
+    router = Router()
+    route = router.get("https://foo.bar/") % dict(content=b"foobar")
+
+    request = httpx.Request("GET", "https://foo.bar/")
+    response1 = router.handler(request)
+    response2 = await router.async_handler(request)
+
+    assert response1 is not response2
+    assert response1.request is request
+    assert response1.content == response2.content == b"foobar"
+    assert route.return_value is not None
+    assert response1.content is route.return_value.content
+    assert response1.headers == response2.headers
+
+
 async def test_async_side_effect():
     router = Router()
 
@@ -214,7 +387,7 @@ def test_side_effect_with_route_kwarg():
             route.mock(return_value=httpx.Response(501))
         return response
 
-    router.post(path__regex=r"/(?P<slug>\w+)/").mock(side_effect=foobar)
+    route = router.post(path__regex=r"/(?P<slug>\w+)/").mock(side_effect=foobar)
 
     request = httpx.Request("POST", "https://foo.bar/baz/")
     response = router.handler(request)
@@ -228,6 +401,11 @@ def test_side_effect_with_route_kwarg():
     response = router.handler(request)
     assert response.status_code == 501
 
+    route.side_effect = lambda request, slug: httpx.Response(202, json={"slug": slug})
+    response = router.handler(request)
+    assert response.status_code == 202
+    assert response.json() == {"slug": "baz"}
+
 
 def test_side_effect_with_reserved_route_kwarg():
     router = Router()
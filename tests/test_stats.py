@@ -36,6 +36,9 @@ async def backend_test():
     with pytest.raises(AssertionError, match="Expected 'respx' to have been called"):
         respx.calls.assert_called_once()
 
+    with pytest.raises(AssertionError, match="Expected 'respx' to have been called"):
+        respx.calls.assert_called()
+
     with pytest.raises(AssertionError, match="Expected '<Route name='get_foobar'"):
         foobar1.calls.assert_called_once()
 
@@ -48,6 +51,10 @@ async def backend_test():
     assert foobar1.call_count == 1
     assert foobar2.call_count == 1
     assert foobar1.calls.call_count == 1
+    foobar1.calls.assert_called()
+
+    with pytest.raises(AssertionError, match="to not have been called. Called 1"):
+        foobar1.calls.assert_not_called()
 
     _request, _response = foobar1.calls[-1]
     assert isinstance(_request, httpx.Request)
@@ -89,6 +96,42 @@ async def backend_test():
     assert route.name == foobar2.name
 
 
+def test_deprecated_mock_api():
+    with respx.mock:
+        route = respx.get("https://foo.bar/")
+        httpx.get("https://foo.bar/")
+
+        with pytest.warns(DeprecationWarning):
+            assert route.calls.call_args is None
+        with pytest.warns(DeprecationWarning):
+            assert route.calls.call_args_list == []
+        with pytest.warns(DeprecationWarning):
+            assert route.calls.mock_calls == []
+        with pytest.warns(DeprecationWarning):
+            route.calls.assert_has_calls([])
+        with pytest.warns(DeprecationWarning), pytest.raises(AssertionError):
+            route.calls.assert_called_with()
+        with pytest.warns(DeprecationWarning), pytest.raises(AssertionError):
+            route.calls.assert_called_once_with()
+        with pytest.warns(DeprecationWarning), pytest.raises(AssertionError):
+            route.calls.assert_any_call()
+
+        with pytest.warns(DeprecationWarning):
+            route.calls.configure_mock(foo="bar")
+        with pytest.warns(DeprecationWarning):
+            assert route.calls.foo == "bar"
+        with pytest.warns(DeprecationWarning):
+            assert route.calls.ham.spam is route.calls.ham.spam
+
+        # Resetting the mock does not clear the recorded calls
+        with pytest.warns(DeprecationWarning):
+            route.calls.reset_mock()
+        assert route.call_count == 1
+
+        with pytest.raises(AttributeError):
+            route.calls._foobar
+
+
 def test_asyncio():
     import asyncio
 
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from respx.utils import SetCookie
+from respx.utils import MultiItems, SetCookie
 
 
 class TestSetCookie:
@@ -31,3 +31,17 @@ class TestSetCookie:
                 "Partitioned"
             ),
         )
+
+
+class TestMultiItems:
+    def test_multi_items(self) -> None:
+        items = MultiItems([("foo", "bar"), ("ham", ["spam", "egg"])])
+        items.append("foo", "baz")
+        assert items.get_list("foo") == ["bar", "baz"]
+        assert items.get_list("ham") == ["spam", "egg"]
+        assert items.multi_items() == [
+            ("foo", "bar"),
+            ("foo", "baz"),
+            ("ham", "spam"),
+            ("ham", "egg"),
+        ]